@@ -105,6 +105,8 @@ REFORMAT_PATTERNS = [
     WAGS_TAILS_PATTERN,
     LIST_SOURCES_CMD_PATTERN
 ]
+_REFORMAT_RE = re.compile("|".join(f"(?:{p})" for p in REFORMAT_PATTERNS))
+_STR_RE = re.compile(STR_PATTERN)
 
 
 def _add_formatting_to_string(line: str) -> str:
@@ -115,9 +117,7 @@ def _add_formatting_to_string(line: str) -> str:
     * all caps SNAKE_CASE env vars, eg "GENE_NORM_REMOTE_DB_URL"
     * the name of this library, "wags-tails"
     """
-    for pattern in REFORMAT_PATTERNS:
-        line = re.sub(pattern, lambda x: f"``{x.group()}``", line)
-    return line
+    return _REFORMAT_RE.sub(lambda x: f"``{x.group()}``", line)
 
 
 def process_description(app: Sphinx, ctx: Context, lines: List[str]):
@@ -128,54 +128,45 @@ def process_description(app: Sphinx, ctx: Context, lines: List[str]):
     * add code block formatting to example shell commands
     * move primary usage example to the top of the description
 
-    Because we have to modify the lines list in place, we have to make multiple passes
-    through it to format everything correctly.
+    The formatted description is built up in a new list in a single pass, and then
+    used to replace the contents of the list provided by sphinx-click.
     """
     if not lines:
         return
 
     # chop off params
-    param_boundary = None
     for i, line in enumerate(lines):
         if ":param" in line:
-            param_boundary = i
+            del lines[i:]
+            lines[-1] = ""
             break
-    if param_boundary is not None:
-        del lines[param_boundary:]
-        lines[-1] = ""
-
-    # add custom formatting to strings, commands, and env vars
-    lines_to_fmt = []
-    for i, line in enumerate(lines):
-        if line.startswith(("   ", ">>> ", "|")):
-            continue  # skip example code blocks
-        if any(re.findall(pattern, line) for pattern in REFORMAT_PATTERNS):
-            lines_to_fmt.append(i)
-    for line_num in lines_to_fmt:
-        lines[line_num] = _add_formatting_to_string(lines[line_num])
-
-    # add code block formatting to example console commands
-    for i in range(len(lines) - 1, -1, -1):
-        if lines[i].startswith(("    ", "|     ")):
-            if lines[i].startswith("|     "):
-                lines[i] = lines[i][3:]
-            if (i == 0 or lines[i - 1] == "\b" or lines[i - 1] == ""):
-                lines.insert(i, "")
-                lines.insert(i, ".. code-block:: console")
 
     # put usage at the top of the description
-    lines.insert(0, "")
-    for usage_line in _get_usage(ctx).splitlines()[::-1]:
-        lines.insert(0, _indent(usage_line))
-    lines.insert(0, "")
-    lines.insert(0, ".. code-block:: shell")
+    out = [".. code-block:: shell", ""]
+    out.extend(_indent(usage_line) for usage_line in _get_usage(ctx).splitlines())
+    out.append("")
+
+    prev_line = None
+    for line in lines:
+        if line.startswith(("    ", "|     ")):
+            # add code block formatting to example console commands
+            if prev_line in (None, "\b", ""):
+                out.extend((".. code-block:: console", ""))
+            out.append(line[3:] if line.startswith("|     ") else line)
+        elif line.startswith(("   ", ">>> ", "|")):
+            out.append(line)  # skip other example code blocks
+        else:
+            # add custom formatting to strings, commands, and env vars
+            out.append(_add_formatting_to_string(line))
+        prev_line = line
+    lines[:] = out
 
 
 def process_option(app: Sphinx, ctx: Context, lines: List[str]):
     """Add fixed-width formatting to strings in sphinx-click autodoc option descriptions."""
     for i, line in enumerate(lines):
-        if re.findall(STR_PATTERN, line):
-            lines[i] = re.sub(STR_PATTERN, lambda x: f"``{x.group()}``", line)
+        if _STR_RE.search(line):
+            lines[i] = _STR_RE.sub(lambda x: f"``{x.group()}``", line)
 
 
 def setup(app):
@@ -187,3 +178,4 @@ def setup(app):
     app.connect("sphinx-click-process-description", process_description)
     app.connect("sphinx-click-process-options", process_option)
     app.connect("sphinx-click-process-usage", lambda app, ctx, lines: lines.clear())
+    return {"parallel_read_safe": True, "parallel_write_safe": True}
@@ -1,28 +1,32 @@
 """Data acquisition tools for Wagnerds."""
 
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING
 
-from wags_tails.base_source import DataSource, RemoteDataError
-from wags_tails.chembl import ChemblData
-from wags_tails.chemidplus import ChemIDplusData
-from wags_tails.custom import CustomData
-from wags_tails.do import DoData
-from wags_tails.drugbank import DrugBankData
-from wags_tails.drugsatfda import DrugsAtFdaData
-from wags_tails.ensembl import EnsemblData
-from wags_tails.ensembl_transcript_mappings import EnsemblTranscriptMappingData
-from wags_tails.guide_to_pharmacology import GToPLigandData
-from wags_tails.hemonc import HemOncData
-from wags_tails.hgnc import HgncData
-from wags_tails.hpo import HpoData
-from wags_tails.moa import MoaData
-from wags_tails.mondo import MondoData
-from wags_tails.ncbi import NcbiGeneData, NcbiGenomeData
-from wags_tails.ncbi_lrg_refseqgene import NcbiLrgRefSeqGeneData
-from wags_tails.ncbi_mane_summary import NcbiManeSummaryData
-from wags_tails.ncit import NcitData
-from wags_tails.oncotree import OncoTreeData
-from wags_tails.rxnorm import RxNormData
+if TYPE_CHECKING:
+    # mirror _LAZY_IMPORTS below so static type checkers can resolve package members
+    from wags_tails.base_source import DataSource, RemoteDataError
+    from wags_tails.chembl import ChemblData
+    from wags_tails.chemidplus import ChemIDplusData
+    from wags_tails.custom import CustomData
+    from wags_tails.do import DoData
+    from wags_tails.drugbank import DrugBankData
+    from wags_tails.drugsatfda import DrugsAtFdaData
+    from wags_tails.ensembl import EnsemblData
+    from wags_tails.ensembl_transcript_mappings import EnsemblTranscriptMappingData
+    from wags_tails.guide_to_pharmacology import GToPLigandData
+    from wags_tails.hemonc import HemOncData
+    from wags_tails.hgnc import HgncData
+    from wags_tails.hpo import HpoData
+    from wags_tails.moa import MoaData
+    from wags_tails.mondo import MondoData
+    from wags_tails.ncbi import NcbiGeneData, NcbiGenomeData
+    from wags_tails.ncbi_lrg_refseqgene import NcbiLrgRefSeqGeneData
+    from wags_tails.ncbi_mane_summary import NcbiManeSummaryData
+    from wags_tails.ncit import NcitData
+    from wags_tails.oncotree import OncoTreeData
+    from wags_tails.rxnorm import RxNormData
 
 try:
     __version__ = version("wags-tails")
@@ -31,29 +35,61 @@ except PackageNotFoundError:
 finally:
     del version, PackageNotFoundError
 
-__all__ = [
-    "ChemIDplusData",
-    "ChemblData",
-    "CustomData",
-    "DataSource",
-    "DoData",
-    "DrugBankData",
-    "DrugsAtFdaData",
-    "EnsemblData",
-    "EnsemblTranscriptMappingData",
-    "GToPLigandData",
-    "HemOncData",
-    "HgncData",
-    "HpoData",
-    "MoaData",
-    "MondoData",
-    "NcbiGeneData",
-    "NcbiGenomeData",
-    "NcbiLrgRefSeqGeneData",
-    "NcbiManeSummaryData",
-    "NcitData",
-    "OncoTreeData",
-    "RemoteDataError",
-    "RxNormData",
-    "__version__",
-]
+# Source classes are imported on first access (PEP 562), so that e.g. reading
+# ``__version__`` or using a single source doesn't load every source module.
+_LAZY_IMPORTS = {
+    "ChemIDplusData": "chemidplus",
+    "ChemblData": "chembl",
+    "CustomData": "custom",
+    "DataSource": "base_source",
+    "DoData": "do",
+    "DrugBankData": "drugbank",
+    "DrugsAtFdaData": "drugsatfda",
+    "EnsemblData": "ensembl",
+    "EnsemblTranscriptMappingData": "ensembl_transcript_mappings",
+    "GToPLigandData": "guide_to_pharmacology",
+    "HemOncData": "hemonc",
+    "HgncData": "hgnc",
+    "HpoData": "hpo",
+    "MoaData": "moa",
+    "MondoData": "mondo",
+    "NcbiGeneData": "ncbi",
+    "NcbiGenomeData": "ncbi",
+    "NcbiLrgRefSeqGeneData": "ncbi_lrg_refseqgene",
+    "NcbiManeSummaryData": "ncbi_mane_summary",
+    "NcitData": "ncit",
+    "OncoTreeData": "oncotree",
+    "RemoteDataError": "base_source",
+    "RxNormData": "rxnorm",
+}
+
+__all__ = list(_LAZY_IMPORTS)
+__all__.append("__version__")
+
+
+def __getattr__(name: str) -> object:
+    """Import source classes and submodules on first access.
+
+    :param name: name of attribute to get
+    :return: requested attribute
+    :raise AttributeError: if ``name`` isn't a member or submodule of this package
+    """
+    if name in _LAZY_IMPORTS:
+        value = getattr(import_module(f".{_LAZY_IMPORTS[name]}", __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        return import_module(f".{name}", __name__)
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise  # submodule exists, but one of its own imports failed
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+
+def __dir__() -> list[str]:
+    """Include lazily-imported members in ``dir()`` output.
+
+    :return: sorted list of package attributes
+    """
+    return sorted({*globals(), *__all__})
@@ -44,7 +44,8 @@ class DataSource(abc.ABC):
         """
         if not data_dir:
             data_dir = get_data_dir() / self._src_name
-        data_dir.mkdir(exist_ok=True)
+        if not data_dir.is_dir():
+            data_dir.mkdir(exist_ok=True)
         self.data_dir = data_dir
 
         self._tqdm_params = {
@@ -53,6 +54,7 @@ class DataSource(abc.ABC):
             "ncols": 80,
             "unit_divisor": 1024,
             "unit_scale": True,
+            "mininterval": 0.5,
         }
 
     @abc.abstractmethod
@@ -146,18 +148,23 @@ class GitHubDataSource(DataSource):
         """Lazily get versions (i.e. not the files themselves, just their version
         strings), starting with the most recent value and moving backwards.
 
+        Releases are requested one page at a time, following the ``Link`` header
+        provided by the GitHub API, so that later pages are only fetched if the caller
+        keeps iterating.
+
         :return: Generator yielding version strings
         """
         url = f"https://api.github.com/repos/{self._repo}/releases"
-        response = requests.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.json()
-        for release in data:
-            yield (
-                datetime.datetime.strptime(release["tag_name"], "v%Y-%m-%d")
-                .replace(tzinfo=datetime.UTC)
-                .strftime(DATE_VERSION_PATTERN)
-            )
+        while url:
+            response = requests.get(url, timeout=HTTPS_REQUEST_TIMEOUT)
+            response.raise_for_status()
+            for release in response.json():
+                yield (
+                    datetime.datetime.strptime(release["tag_name"], "v%Y-%m-%d")
+                    .replace(tzinfo=datetime.UTC)
+                    .strftime(DATE_VERSION_PATTERN)
+                )
+            url = response.links.get("next", {}).get("url")
 
     def _get_latest_version(self) -> str:
         """Acquire value of latest data version.
@@ -1,14 +1,15 @@
 """Provide source fetching for ChEMBL."""
 
-import fnmatch
 import re
 import tarfile
 from pathlib import Path
-
-import requests
+from typing import BinaryIO
 
 from .base_source import DataSource, RemoteDataError
-from .utils.downloads import HTTPS_REQUEST_TIMEOUT, download_http
+from .utils.downloads import conditional_get, download_http_stream
+
+_RELEASE_RE = re.compile(r"\*\s*Release:\s*chembl_(\d+)")
+_DB_MEMBER_RE = re.compile(r"chembl_.*\.db\Z", re.DOTALL)
 
 
 class ChemblData(DataSource):
@@ -17,40 +18,88 @@ class ChemblData(DataSource):
     _src_name = "chembl"
     _filetype = "db"
 
-    @staticmethod
-    def _get_latest_version() -> str:
-        """Retrieve latest version value
+    def __init__(self, data_dir: Path | None = None, silent: bool = True) -> None:
+        """Set common class parameters.
+
+        :param data_dir: direct location to store data files in, if specified. See
+            ``get_data_dir()`` in the ``storage_utils`` module for further configuration
+            details.
+        :param silent: if True, don't print any info/updates to console
+        """
+        super().__init__(data_dir, silent)
+        self._latest_version: str | None = None
+
+    def get_latest(
+        self, from_local: bool = False, force_refresh: bool = False
+    ) -> tuple[Path, str]:
+        """Get path to latest version of data.
+
+        The latest version value is only fetched from the remote README once per
+        instance, unless ``force_refresh`` is set.
+
+        :param from_local: if True, use latest available local file
+        :param force_refresh: if True, fetch and return data from remote regardless of
+            whether a local copy is present
+        :return: Path to location of data, and version value of it
+        :raise ValueError: if both ``force_refresh`` and ``from_local`` are True
+        """
+        if force_refresh:
+            self._latest_version = None
+        return super().get_latest(from_local, force_refresh)
+
+    def _get_latest_version(self) -> str:
+        """Retrieve latest version value, reusing the previously-fetched value if
+        available.
+
+        :return: latest release value
+        """
+        if self._latest_version is None:
+            self._latest_version = self._fetch_latest_version()
+        return self._latest_version
+
+    def _fetch_latest_version(self) -> str:
+        """Retrieve latest version value from the ChEMBL README
+
+        A copy of the README is kept in the data directory so that it's only
+        re-downloaded when it has changed remotely.
 
         :return: latest release value
         :raise RemoteDataError: if unable to parse version number from README
         """
-        latest_readme_url = (
-            "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README"
+        data = conditional_get(
+            "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README",
+            self.data_dir / "_chembl_readme",
         )
-        response = requests.get(latest_readme_url, timeout=HTTPS_REQUEST_TIMEOUT)
-        response.raise_for_status()
-        data = response.text
-        pattern = re.compile(r"\*\s*Release:\s*chembl_(\d*).*")
         for line in data.splitlines():
-            m = re.match(pattern, line)
-            if m and m.group():
+            m = _RELEASE_RE.match(line)
+            if m:
                 return m.group(1)
-        else:
-            msg = "Unable to parse latest ChEMBL version number from latest release README"
-            raise RemoteDataError(msg)
+        msg = "Unable to parse latest ChEMBL version number from latest release README"
+        raise RemoteDataError(msg)
 
     @staticmethod
-    def _tarball_handler(dl_path: Path, outfile_path: Path) -> None:
-        """Get ChEMBL file from tarball. Callback to pass to download methods.
+    def _tarball_handler(stream: BinaryIO, outfile_path: Path) -> None:
+        """Get ChEMBL file from streamed tarball. Callback to pass to download methods.
+
+        The database is extracted to a temporary ``.part`` file and only moved to
+        ``outfile_path`` once extraction completes, so an interrupted download doesn't
+        leave a truncated file that looks like a finished one.
 
-        :param dl_path: path to temp data file
+        :param stream: file-like object providing the tarball contents
         :param outfile_path: path to save file within
         """
-        with tarfile.open(dl_path, "r:gz") as tar:
-            for file in tar.getmembers():
-                if fnmatch.fnmatch(file.name, "chembl_*.db"):
-                    file.name = outfile_path.name
-                    tar.extract(file, path=outfile_path.parent)
+        part_path = outfile_path.with_name(f"{outfile_path.name}.part")
+        try:
+            with tarfile.open(fileobj=stream, mode="r|gz") as tar:
+                for file in tar:
+                    if _DB_MEMBER_RE.match(file.name):
+                        file.name = part_path.name
+                        tar.extract(file, path=outfile_path.parent)
+                        part_path.replace(outfile_path)
+                        break
+        except BaseException:
+            part_path.unlink(missing_ok=True)
+            raise
 
     def _download_data(self, version: str, outfile: Path) -> None:
         """Download data file to specified location.
@@ -58,7 +107,7 @@ class ChemblData(DataSource):
         :param version: version to acquire
         :param outfile: location and filename for final data file
         """
-        download_http(
+        download_http_stream(
             f"https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/chembl_{version}_sqlite.tar.gz",
             outfile,
             handler=self._tarball_handler,
@@ -5,10 +5,12 @@ import gzip
 import logging
 import os
 import re
+import shutil
 import tempfile
 import zipfile
 from collections.abc import Callable
 from pathlib import Path
+from typing import BinaryIO
 
 import requests
 from tqdm import tqdm
@@ -17,6 +19,7 @@ _logger = logging.getLogger(__name__)
 
 
 HTTPS_REQUEST_TIMEOUT = 30
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
 
 
 def handle_zip(dl_path: Path, outfile_path: Path) -> None:
@@ -97,6 +100,19 @@ def download_ftp(
     _logger.info("Successfully downloaded %s.", outfile_path.name)
 
 
+def _print_download_url(url: str) -> None:
+    """Print name of file being downloaded to console.
+
+    :param url: URL that file is being retrieved from
+    """
+    if "apiKey" in url:  # don't print RxNorm API key
+        pattern = r"&apiKey=.{8}-.{4}-.{4}-.{4}-.{12}"
+        print_url = re.sub(pattern, "", os.path.basename(url))  # noqa: PTH119
+        print(f"Downloading {print_url}...")
+    else:
+        print(f"Downloading {os.path.basename(url)}...")  # noqa: PTH119
+
+
 def download_http(
     url: str,
     outfile_path: Path,
@@ -126,22 +142,105 @@ def download_http(
         url, stream=True, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT
     ) as r:
         r.raise_for_status()
+        r.raw.decode_content = True
         total_size = int(r.headers.get("content-length", 0))
         if not tqdm_params.get("disable"):
-            if "apiKey" in url:  # don't print RxNorm API key
-                pattern = r"&apiKey=.{8}-.{4}-.{4}-.{4}-.{12}"
-                print_url = re.sub(pattern, "", os.path.basename(url))  # noqa: PTH119
-                print(f"Downloading {print_url}...")
-            else:
-                print(f"Downloading {os.path.basename(url)}...")  # noqa: PTH119
+            _print_download_url(url)
         with (
             dl_path.open("wb") as h,
-            tqdm(total=total_size, **tqdm_params) as progress_bar,
+            tqdm.wrapattr(r.raw, "read", total=total_size, **tqdm_params) as stream,
         ):
-            for chunk in r.iter_content(chunk_size=8192):
-                if chunk:
-                    h.write(chunk)
-                    progress_bar.update(len(chunk))
+            shutil.copyfileobj(stream, h, length=DOWNLOAD_CHUNK_SIZE)
     if handler:
         handler(dl_path, outfile_path)
     _logger.info("Successfully downloaded %s.", outfile_path.name)
+
+
+def download_http_stream(
+    url: str,
+    outfile_path: Path,
+    handler: Callable[[BinaryIO, Path], None],
+    headers: dict | None = None,
+    tqdm_params: dict | None = None,
+) -> None:
+    """Perform HTTP download of remote data file, passing the response body directly
+    to a handler as a file-like object rather than saving it to a temporary file first.
+
+    Useful for large archives where only a portion of the contents is needed and the
+    format can be read sequentially (e.g. a streamed tarball). Because data is written
+    while the download is still in progress, handlers should write to a temporary
+    location and only move it to ``outfile_path`` once complete.
+
+    :param url: URL to retrieve file from
+    :param outfile_path: path to where file should be saved. Must be an actual
+        Path instance rather than merely a pathlike string.
+    :param handler: callback which reads the response stream and saves the desired
+        data to ``outfile_path``
+    :param headers: Any needed HTTP headers to include in request
+    :param tqdm_params: Optional TQDM configuration.
+    """
+    if not tqdm_params:
+        tqdm_params = {}
+    _logger.info("Downloading %s from %s...", outfile_path.name, url)
+    with requests.get(
+        url, stream=True, headers=headers, timeout=HTTPS_REQUEST_TIMEOUT
+    ) as r:
+        r.raise_for_status()
+        r.raw.decode_content = True
+        total_size = int(r.headers.get("content-length", 0))
+        if not tqdm_params.get("disable"):
+            _print_download_url(url)
+        with tqdm.wrapattr(r.raw, "read", total=total_size, **tqdm_params) as stream:
+            handler(stream, outfile_path)
+    _logger.info("Successfully downloaded %s.", outfile_path.name)
+
+
+def conditional_get(url: str, cache_path: Path, headers: dict | None = None) -> str:
+    """Get text content of a remote resource, reusing a locally-cached copy if the
+    server reports that it's unchanged.
+
+    The ``ETag`` and ``Last-Modified`` response headers are saved alongside the cached
+    copy (as ``<cache_path>.etag`` and ``<cache_path>.lastmod``) and sent back as
+    ``If-None-Match`` and ``If-Modified-Since`` on subsequent requests.
+
+    :param url: URL to retrieve content from
+    :param cache_path: location to store cached copy of the content
+    :param headers: Any needed HTTP headers to include in request
+    :return: text content of resource
+    """
+    etag_path = cache_path.with_name(f"{cache_path.name}.etag")
+    lastmod_path = cache_path.with_name(f"{cache_path.name}.lastmod")
+    request_headers = dict(headers) if headers else {}
+    if cache_path.exists():
+        if etag_path.exists():
+            request_headers["If-None-Match"] = etag_path.read_text(encoding="utf-8")
+        if lastmod_path.exists():
+            request_headers["If-Modified-Since"] = lastmod_path.read_text(
+                encoding="utf-8"
+            )
+
+    response = requests.get(url, headers=request_headers, timeout=HTTPS_REQUEST_TIMEOUT)
+    response.raise_for_status()
+    if response.status_code == requests.codes.not_modified:
+        _logger.debug("Using cached copy of %s at %s.", url, cache_path)
+        return cache_path.read_text(encoding="utf-8")
+
+    # skip requests' charset detection if the server doesn't declare an encoding
+    encoding = response.encoding or "utf-8"
+    try:
+        text = response.content.decode(encoding)
+    except UnicodeDecodeError:
+        # don't keep a lossy copy around to be served on future 304 responses
+        _logger.warning("Unable to decode %s as %s; not caching it.", url, encoding)
+        for path in (cache_path, etag_path, lastmod_path):
+            path.unlink(missing_ok=True)
+        return response.content.decode(encoding, errors="replace")
+
+    cache_path.write_text(text, encoding="utf-8")
+    for header, path in (("ETag", etag_path), ("Last-Modified", lastmod_path)):
+        value = response.headers.get(header)
+        if value:
+            path.write_text(value, encoding="utf-8")
+        else:
+            path.unlink(missing_ok=True)
+    return text
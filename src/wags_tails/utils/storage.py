@@ -22,27 +22,23 @@ def get_data_dir() -> Path:
     :return: path to base data directory
     """
     spec_wagstails_dir = os.environ.get("WAGS_TAILS_DIR")
+    xdg_data_home = os.environ.get("XDG_DATA_HOME")
     if spec_wagstails_dir:
         data_base_dir = Path(spec_wagstails_dir)
+    elif xdg_data_home:
+        data_base_dir = Path(xdg_data_home) / "wags_tails"
     else:
-        xdg_data_home = os.environ.get("XDG_DATA_HOME")
-        if xdg_data_home:
-            data_base_dir = Path(xdg_data_home) / "wags_tails"
+        xdg_data_dirs = os.environ.get("XDG_DATA_DIRS", "")
+        for directory in filter(None, xdg_data_dirs.split(":")):
+            dir_path = Path(directory) / "wags_tails"
+            if not dir_path.is_file():
+                data_base_dir = dir_path
+                break
         else:
-            xdg_data_dirs = os.environ.get("XDG_DATA_DIRS")
-            if xdg_data_dirs:
-                dirs = os.environ["XDG_DATA_DIRS"].split(":")
-                for directory in dirs:
-                    dir_path = Path(directory) / "wags_tails"
-                    if not dir_path.is_file():
-                        data_base_dir = dir_path
-                        break
-                else:
-                    data_base_dir = Path.home() / ".local" / "share" / "wags_tails"
-            else:
-                data_base_dir = Path.home() / ".local" / "share" / "wags_tails"
+            data_base_dir = Path.home() / ".local" / "share" / "wags_tails"
 
-    data_base_dir.mkdir(exist_ok=True, parents=True)
+    if not data_base_dir.is_dir():
+        data_base_dir.mkdir(exist_ok=True, parents=True)
     return data_base_dir
 
 
@@ -55,10 +51,9 @@ def get_latest_local_file(directory: Path, glob: str) -> Path:
     :raise FileNotFoundError: if no local data is available
     """
     _logger.debug("Getting local match against pattern %s...", glob)
-    files = sorted(directory.glob(glob))
-    if not files:
+    latest = max(directory.glob(glob), default=None)
+    if latest is None:
         msg = f"Unable to find file in {directory.absolute()} matching pattern {glob}"
         raise FileNotFoundError(msg)
-    latest = files[-1]
     _logger.debug("Returning %s as most recent locally-available file.", latest)
     return latest
@@ -7,6 +7,7 @@ from pathlib import Path
 import pytest
 
 from wags_tails.mondo import MondoData
+from wags_tails.utils.storage import get_data_dir
 
 
 @pytest.fixture
@@ -44,6 +45,27 @@ def test_config_directory(base_data_dir: Path):
     assert m.data_dir == wags_dir / "mondo"
 
 
+def test_uncached_directory_configs(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Test that directory resolution responds to changes in $HOME and filesystem
+    state, not just the wags-tails/XDG env vars.
+    """
+    for varname in ("XDG_DATA_DIRS", "XDG_DATA_HOME", "WAGS_TAILS_DIR"):
+        monkeypatch.delenv(varname, raising=False)
+
+    monkeypatch.setenv("HOME", str(tmp_path / "h1"))
+    assert get_data_dir() == tmp_path / "h1" / ".local" / "share" / "wags_tails"
+    monkeypatch.setenv("HOME", str(tmp_path / "h2"))
+    assert get_data_dir() == tmp_path / "h2" / ".local" / "share" / "wags_tails"
+
+    dir_a = tmp_path / "a"
+    dir_b = tmp_path / "b"
+    monkeypatch.setenv("XDG_DATA_DIRS", f"{dir_a}:{dir_b}")
+    assert get_data_dir() == dir_a / "wags_tails"
+    (dir_a / "wags_tails").rmdir()
+    (dir_a / "wags_tails").touch()
+    assert get_data_dir() == dir_b / "wags_tails"
+
+
 @pytest.mark.skipif(
     os.environ.get("WAGS_TAILS_TEST_ENV", "").lower() != "true", reason="Not in CI"
 )
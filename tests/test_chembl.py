@@ -1,5 +1,8 @@
 """Test ChEMBL data source."""
 
+import io
+import os
+import tarfile
 from io import TextIOWrapper
 from pathlib import Path
 
@@ -67,26 +70,103 @@ def test_get_latest(
         assert version == "33"
         assert m.call_count == 2
 
+        # latest version is cached on the instance
         path, version = chembl.get_latest()
         assert path == chembl_data_dir / "chembl_33.db"
         assert path.exists()
         assert version == "33"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         path, version = chembl.get_latest(from_local=True)
         assert path == chembl_data_dir / "chembl_33.db"
         assert path.exists()
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         (chembl_data_dir / "chembl_32.db").touch()
         path, version = chembl.get_latest(from_local=True)
         assert path == chembl_data_dir / "chembl_33.db"
         assert path.exists()
         assert version == "33"
-        assert m.call_count == 3
+        assert m.call_count == 2
 
         path, version = chembl.get_latest(force_refresh=True)
         assert path == chembl_data_dir / "chembl_33.db"
         assert path.exists()
         assert version == "33"
+        assert m.call_count == 4
+
+        # a new instance fetches the latest version again
+        path, version = ChemblData(chembl_data_dir, silent=True).get_latest()
+        assert path == chembl_data_dir / "chembl_33.db"
+        assert version == "33"
         assert m.call_count == 5
+
+
+def test_get_latest_version_cached_readme(
+    chembl_data_dir: Path, chembl_latest_readme: str
+):
+    """Test that the latest release README is only re-downloaded if it's changed"""
+    url = "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README"
+    with requests_mock.Mocker() as m:
+        m.get(url, text=chembl_latest_readme, headers={"ETag": '"abc123"'})
+        m.get(url, request_headers={"If-None-Match": '"abc123"'}, status_code=304)
+
+        (chembl_data_dir / "chembl_33.db").touch()
+        _, version = ChemblData(chembl_data_dir, silent=True).get_latest()
+        assert version == "33"
+        assert "If-None-Match" not in m.last_request.headers
+        assert (chembl_data_dir / "_chembl_readme.etag").read_text() == '"abc123"'
+
+        _, version = ChemblData(chembl_data_dir, silent=True).get_latest()
+        assert version == "33"
+        assert m.last_request.headers["If-None-Match"] == '"abc123"'
+        assert m.call_count == 2
+
+
+def test_get_latest_version_undecodable_readme(
+    chembl_data_dir: Path, chembl_latest_readme: str
+):
+    """Test that a README which can't be cleanly decoded isn't cached"""
+    url = "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README"
+    with requests_mock.Mocker() as m:
+        m.get(
+            url,
+            content=b"\xff" + chembl_latest_readme.encode(),
+            headers={"ETag": '"abc123"', "Content-Type": "text/plain; charset=utf-8"},
+        )
+        (chembl_data_dir / "chembl_33.db").touch()
+        _, version = ChemblData(chembl_data_dir, silent=True).get_latest()
+        assert version == "33"
+        assert not (chembl_data_dir / "_chembl_readme").exists()
+        assert not (chembl_data_dir / "_chembl_readme.etag").exists()
+
+
+def test_get_latest_interrupted_download(
+    chembl_data_dir: Path, chembl_latest_readme: str
+):
+    """Test that a dropped connection doesn't leave a partial database behind"""
+    # use incompressible data so the tarball is read across many chunks
+    db_contents = os.urandom(2 * 1024 * 1024)
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        member = tarfile.TarInfo("chembl_33/chembl_33_sqlite/chembl_33.db")
+        member.size = len(db_contents)
+        tar.addfile(member, io.BytesIO(db_contents))
+    tarball = buf.getvalue()
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/README",
+            text=chembl_latest_readme,
+        )
+        tarball_url = "https://ftp.ebi.ac.uk/pub/databases/chembl/ChEMBLdb/latest/chembl_33_sqlite.tar.gz"
+        m.get(tarball_url, content=tarball[: len(tarball) // 2])
+        with pytest.raises(tarfile.ReadError):
+            ChemblData(chembl_data_dir, silent=True).get_latest()
+        assert list(chembl_data_dir.glob("chembl_33.db*")) == []
+
+        m.get(tarball_url, content=tarball)
+        path, version = ChemblData(chembl_data_dir, silent=True).get_latest()
+        assert version == "33"
+        assert path.read_bytes() == db_contents
+        assert list(chembl_data_dir.glob("chembl_33.db*")) == [path]
@@ -0,0 +1,53 @@
+"""Test package-level lazy imports."""
+
+import ast
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import wags_tails
+
+
+def test_lazy_import_names():
+    """Check that type-checking imports cover the same names as the lazy loader."""
+    tree = ast.parse(Path(wags_tails.__file__).read_text())
+    type_checking_block = next(
+        node
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "TYPE_CHECKING"
+    )
+    imported = {
+        alias.name: node.module.removeprefix("wags_tails.")
+        for node in type_checking_block.body
+        for alias in node.names
+    }
+    assert imported == wags_tails._LAZY_IMPORTS  # noqa: SLF001
+    assert set(wags_tails.__all__) == {*imported, "__version__"}
+
+
+def test_lazy_import_access():
+    """Check access to package members and submodules."""
+    from wags_tails.mondo import MondoData
+
+    assert wags_tails.MondoData is MondoData
+    assert wags_tails.mondo.MondoData is MondoData
+    assert wags_tails.utils.storage.get_data_dir
+    assert "ChemblData" in dir(wags_tails)
+    with pytest.raises(AttributeError, match="has no attribute 'not_a_member'"):
+        wags_tails.not_a_member  # noqa: B018
+
+    # reading the version shouldn't load any data source modules
+    result = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys, wags_tails; wags_tails.__version__; "
+            "print('wags_tails.base_source' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "False"
@@ -99,7 +99,7 @@ def test_get_latest(
         assert m.call_count == 5
 
 
-def test_iterate_versions(mondo: MondoData, versions_response: dict):
+def test_iterate_versions(mondo: MondoData, versions_response: list):
     """Test MondoData.iterate_versions()"""
     with requests_mock.Mocker() as m:
         m.get(
@@ -115,6 +115,23 @@ def test_iterate_versions(mondo: MondoData, versions_response: dict):
         ]
 
 
+def test_iterate_versions_paginated(mondo: MondoData, versions_response: list):
+    """Test MondoData.iterate_versions() when releases are split across pages"""
+    url = "https://api.github.com/repos/monarch-initiative/mondo/releases"
+    with requests_mock.Mocker() as m:
+        m.get(
+            url,
+            json=versions_response[:2],
+            headers={"Link": f'<{url}?page=2>; rel="next", <{url}?page=2>; rel="last"'},
+        )
+        m.get(f"{url}?page=2", json=versions_response[2:], complete_qs=True)
+        versions = mondo.iterate_versions()
+        assert next(versions) == "20230912"
+        assert m.call_count == 1
+        assert list(versions) == ["20230802", "20221101", "20210803"]
+        assert m.call_count == 2
+
+
 def test_get_specific_version(
     mondo: MondoData,
     mondo_data_dir: Path,